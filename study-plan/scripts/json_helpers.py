@@ -16,28 +16,48 @@ Commands:
     stats <cards.json>                Print card statistics
     progress <cards.json>             Per-deck breakdown (total, due, mature, struggling, new)
     next-id <file> <prefix>           Print next available ID (e.g., c004, s002)
+    compact-history <cards.json> [keep]       Fold old review history into per-card summaries
+    optimize <project-dir> [retention]        Fit per-deck SM-2 parameters from review history
+    refresh-topics <project-dir> [--all]      Recompute stale topic mastery rollups in topics.json
+    exercise-stats <exercises.json>           Solve rates and timing by pattern and topic
 """
 
 import json
+import os
 import sys
 from datetime import date, datetime, timedelta
-from pathlib import Path
+
+# SM-2 constants. Fitted per-deck values live in data/scheduler.json (see `optimize`).
+SM2_DEFAULTS = {
+    "initial_ease": 2.5,
+    "first_interval": 1,
+    "second_interval": 6,
+    "lapse_interval": 1,
+    "ease_bonus": 0.1,
+    "ease_linear": 0.08,
+    "ease_quadratic": 0.02,
+    "min_ease": 1.3,
+}
+
+# Raw review_history entries kept per card; older ones fold into history_summary.
+# Override per project with a top-level "history_keep" in cards.json.
+HISTORY_KEEP = 20
+# Weight of the newest review in the rolling accuracy (exponential moving average).
+ROLLING_ALPHA = 0.2
 
 
 def load_json(path: str) -> dict:
     """Load a JSON file. Returns empty structure if file doesn't exist."""
-    p = Path(path)
-    if not p.exists():
+    if not os.path.exists(path):
         return {}
-    with open(p) as f:
+    with open(path) as f:
         return json.load(f)
 
 
 def save_json(path: str, data: dict) -> None:
     """Write JSON file with pretty printing."""
-    p = Path(path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    with open(p, "w") as f:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
         f.write("\n")
 
@@ -58,26 +78,40 @@ def query_due_cards(cards_data: dict, today_str: str | None = None) -> list:
     return due
 
 
-def sm2_update(quality: int, ease_factor: float, interval_days: int, repetitions: int, today_str: str | None = None) -> dict:
-    """Apply SM-2 algorithm. Returns updated fields."""
-    today_str = today_str or date.today().isoformat()
-    today_date = datetime.strptime(today_str, "%Y-%m-%d")
+def sm2_step(quality: int, ease_factor: float, interval_days: int, repetitions: int,
+             params: dict | None = None) -> tuple[float, int, int]:
+    """One SM-2 transition. Returns (ease_factor, interval_days, repetitions)."""
+    p = SM2_DEFAULTS if params is None else params
 
     if quality >= 3:  # correct
         if repetitions == 0:
-            interval_days = 1
+            interval_days = p["first_interval"]
         elif repetitions == 1:
-            interval_days = 6
+            interval_days = p["second_interval"]
         else:
             interval_days = round(interval_days * ease_factor)
         repetitions += 1
     else:  # incorrect
         repetitions = 0
-        interval_days = 1
+        interval_days = p["lapse_interval"]
 
+    d = 5 - quality
     ease_factor = max(
-        1.3,
-        ease_factor + (0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        p["min_ease"],
+        ease_factor + (p["ease_bonus"] - d * (p["ease_linear"] + d * p["ease_quadratic"]))
+    )
+
+    return ease_factor, interval_days, repetitions
+
+
+def sm2_update(quality: int, ease_factor: float, interval_days: int, repetitions: int,
+               today_str: str | None = None, params: dict | None = None) -> dict:
+    """Apply SM-2 algorithm. Returns updated fields."""
+    today_str = today_str or date.today().isoformat()
+    today_date = datetime.strptime(today_str, "%Y-%m-%d")
+
+    ease_factor, interval_days, repetitions = sm2_step(
+        quality, ease_factor, interval_days, repetitions, params
     )
 
     next_review = (today_date + timedelta(days=interval_days)).strftime("%Y-%m-%d")
@@ -90,6 +124,276 @@ def sm2_update(quality: int, ease_factor: float, interval_days: int, repetitions
     }
 
 
+# Scheduler name -> update function with sm2_update's signature.
+# data/scheduler.json selects one per project and holds its parameters.
+SCHEDULERS = {"sm2": sm2_update}
+
+
+def load_scheduler(data_dir: str) -> dict:
+    """Load a project's scheduler config (data/scheduler.json). Empty if unfitted."""
+    return load_json(os.path.join(data_dir, "scheduler.json"))
+
+
+def get_scheduler(config: dict):
+    """Return the update function named by a scheduler config."""
+    name = config.get("scheduler", "sm2")
+    if name not in SCHEDULERS:
+        raise ValueError(f"Unknown scheduler {name}")
+    return SCHEDULERS[name]
+
+
+def scheduler_params(config: dict, deck: str | None = None) -> dict:
+    """Scheduler parameters for a deck: SM-2 defaults < project default < deck fit."""
+    return {
+        **SM2_DEFAULTS,
+        **config.get("default", {}),
+        **config.get("decks", {}).get(deck, {}),
+    }
+
+
+def _empty_history_summary() -> dict:
+    return {
+        "reviews": 0,
+        "correct": 0,
+        "lapses": 0,
+        "quality_counts": [0, 0, 0, 0, 0, 0],
+        "first_date": None,
+        "last_date": None,
+        "last_quality": None,
+        "rolling_accuracy": None,
+        "streak": 0,
+        "mature_run": [],
+    }
+
+
+def _fold_review(summary: dict, review: dict) -> None:
+    """Fold one review_history entry into a history summary in place."""
+    quality = review["quality"]
+    hit = 1.0 if quality >= 3 else 0.0
+
+    # Open SM-2 repetition streak, and the ease inputs (reviews, sum d, sum d^2)
+    # before each correct review of its mature run, so the optimizer can
+    # resume from the summary. Summaries written before streak tracking only
+    # know the streak again after a failed review.
+    last = summary["last_quality"]
+    streak = summary.get("streak", 0 if last is not None and last < 3 else None)
+    if not hit:
+        streak = 0
+        summary["mature_run"] = []
+    elif streak is not None:
+        if streak >= 2:
+            counts = summary["quality_counts"]
+            summary.setdefault("mature_run", []).append([
+                summary["reviews"],
+                sum(c * (5 - q) for q, c in enumerate(counts)),
+                sum(c * (5 - q) ** 2 for q, c in enumerate(counts)),
+            ])
+        streak += 1
+        if streak == 2:
+            summary["mature_run"] = []
+    summary["streak"] = streak
+
+    summary["reviews"] += 1
+    summary["correct"] += int(hit)
+    # A lapse is a failed review of a card that was last recalled correctly
+    if not hit and summary["last_quality"] is not None and summary["last_quality"] >= 3:
+        summary["lapses"] += 1
+    summary["quality_counts"][max(0, min(5, quality))] += 1
+    summary["first_date"] = summary["first_date"] or review["date"]
+    summary["last_date"] = review["date"]
+    summary["last_quality"] = quality
+
+    rolling = summary["rolling_accuracy"]
+    rolling = hit if rolling is None else rolling + ROLLING_ALPHA * (hit - rolling)
+    summary["rolling_accuracy"] = round(rolling, 4)
+
+
+def history_aggregate(card: dict) -> dict:
+    """Lifetime review aggregates for a card: compacted summary plus raw history."""
+    summary = card.get("history_summary") or _empty_history_summary()
+    summary = {**summary, "quality_counts": list(summary["quality_counts"]),
+               "mature_run": list(summary.get("mature_run", []))}
+    for review in card.get("review_history", []):
+        _fold_review(summary, review)
+    return summary
+
+
+def compact_card_history(card: dict, keep: int = HISTORY_KEEP) -> int:
+    """Fold all but the last `keep` review_history entries into history_summary.
+
+    Returns the number of entries folded.
+    """
+    history = card.get("review_history", [])
+    excess = len(history) - max(keep, 0)
+    if excess <= 0:
+        return 0
+
+    summary = card.get("history_summary") or _empty_history_summary()
+    for review in history[:excess]:
+        _fold_review(summary, review)
+    card["history_summary"] = summary
+    card["review_history"] = history[excess:]
+    return excess
+
+
+def compact_history(cards_path: str, keep: int | None = None) -> dict:
+    """Compact review history for every card in cards.json.
+
+    An explicit `keep` is stored as the project's retention policy so later
+    reviews are compacted to the same length automatically.
+    """
+    if keep is not None and keep < 0:
+        raise ValueError(f"keep must be >= 0, got {keep}")
+    data = load_json(cards_path)
+    policy_changed = keep is not None and data.get("history_keep") != keep
+    if policy_changed:
+        data["history_keep"] = keep
+    keep = data.get("history_keep", HISTORY_KEEP)
+
+    cards_compacted = 0
+    reviews_folded = 0
+    for card in data.get("cards", []):
+        folded = compact_card_history(card, keep)
+        if folded:
+            cards_compacted += 1
+            reviews_folded += folded
+
+    if cards_compacted or policy_changed:
+        save_json(cards_path, data)
+
+    return {
+        "keep": keep,
+        "cards_compacted": cards_compacted,
+        "reviews_folded": reviews_folded,
+    }
+
+
+def is_mature(card: dict) -> bool:
+    """A card is mature once it is easy, well-spaced and consistently recalled."""
+    return card["ease_factor"] > 2.5 and card["interval_days"] > 21 and card["repetitions"] >= 3
+
+
+def mark_topics_stale(data_dir: str, cards: tuple = (), exercises: tuple = ()) -> None:
+    """Record topics whose card or exercise rollups changed since the last refresh.
+
+    `cards` are deck names and `exercises` topic names; names without a topic
+    in topics.json are ignored. topics.json is only rewritten when a name is new.
+    """
+    topics_path = os.path.join(data_dir, "topics.json")
+    data = load_json(topics_path)
+    names = {t["name"] for t in data.get("topics", [])}
+    stale = data.setdefault("stale", {"cards": [], "exercises": []})
+
+    changed = False
+    for key, marked in (("cards", cards), ("exercises", exercises)):
+        for name in marked:
+            if name in names and name not in stale[key]:
+                stale[key].append(name)
+                changed = True
+    if changed:
+        save_json(topics_path, data)
+
+
+def _topic_depth(name: str, by_name: dict) -> int:
+    depth = 0
+    seen = {name}
+    parent = by_name[name].get("parent")
+    while parent in by_name and parent not in seen:
+        seen.add(parent)
+        depth += 1
+        parent = by_name[parent].get("parent")
+    return depth
+
+
+def _rollup_fields(by_name: dict, children: dict, dirty: set, direct: dict, fields: tuple) -> set:
+    """Recompute `fields` for dirty topics and their ancestors. Returns topics touched.
+
+    Stored values are rollups (own deck plus all descendants). A dirty topic's
+    own count comes from `direct`; an untouched ancestor's is recovered as its
+    stored rollup minus its children's previous rollups.
+    """
+    affected = set()
+    for name in dirty:
+        seen = set()
+        while name in by_name and name not in seen:
+            seen.add(name)
+            affected.add(name)
+            name = by_name[name].get("parent")
+
+    previous = {}
+    for name in sorted(affected, key=lambda n: _topic_depth(n, by_name), reverse=True):
+        topic = by_name[name]
+        kids = children.get(name, [])
+        for field in fields:
+            old = topic.get(field, 0)
+            previous[(name, field)] = old
+            if name in dirty:
+                base = direct.get(name, {}).get(field, 0)
+            else:
+                base = old - sum(previous.get((k, field), by_name[k].get(field, 0)) for k in kids)
+            topic[field] = base + sum(by_name[k].get(field, 0) for k in kids)
+    return affected
+
+
+def refresh_topics(data_dir: str, full: bool = False) -> dict:
+    """Bring topics.json card/exercise rollups up to date.
+
+    Only topics marked stale by card, review and exercise mutations (and
+    their parents) are recomputed, and cards.json / exercises.json are only
+    read if something in them changed. `full` recomputes every topic; it is
+    implied on the first refresh of a project.
+    """
+    topics_path = os.path.join(data_dir, "topics.json")
+    data = load_json(topics_path)
+    topics = data.get("topics", [])
+    by_name = {t["name"]: t for t in topics}
+    children: dict[str, list] = {}
+    for t in topics:
+        if t.get("parent") in by_name:
+            children.setdefault(t["parent"], []).append(t["name"])
+
+    full = full or "refreshed" not in data
+    stale = data.get("stale", {})
+    card_dirty = set(by_name) if full else set(stale.get("cards", [])) & set(by_name)
+    exercise_dirty = set(by_name) if full else set(stale.get("exercises", [])) & set(by_name)
+
+    touched = set()
+    if card_dirty:
+        direct: dict[str, dict] = {}
+        for c in load_json(os.path.join(data_dir, "cards.json")).get("cards", []):
+            deck = c.get("deck")
+            if deck in card_dirty:
+                counts = direct.setdefault(deck, {"total_cards": 0, "mature_cards": 0})
+                counts["total_cards"] += 1
+                counts["mature_cards"] += is_mature(c)
+        card_touched = _rollup_fields(by_name, children, card_dirty, direct,
+                                      ("total_cards", "mature_cards"))
+        for name in card_touched:
+            t = by_name[name]
+            t["mastery"] = round(t["mature_cards"] / t["total_cards"], 4) if t["total_cards"] else 0.0
+        touched |= card_touched
+
+    if exercise_dirty:
+        direct = {}
+        for e in load_json(os.path.join(data_dir, "exercises.json")).get("exercises", []):
+            topic = e.get("topic")
+            if topic in exercise_dirty and e.get("completed"):
+                counts = direct.setdefault(topic, {"exercises_completed": 0})
+                counts["exercises_completed"] += 1
+        touched |= _rollup_fields(by_name, children, exercise_dirty, direct,
+                                  ("exercises_completed",))
+
+    if touched or full or stale.get("cards") or stale.get("exercises"):
+        data["stale"] = {"cards": [], "exercises": []}
+        data["refreshed"] = datetime.now().isoformat(timespec="seconds")
+        save_json(topics_path, data)
+
+    return {
+        "full": full,
+        "refreshed": sorted(touched),
+    }
+
+
 def append_card(cards_path: str, card_data: dict) -> str:
     """Append a card to cards.json. Returns the assigned ID."""
     data = load_json(cards_path)
@@ -98,9 +402,10 @@ def append_card(cards_path: str, card_data: dict) -> str:
 
     card_id = next_id(data["cards"], "c")
     card_data["id"] = card_id
+    params = scheduler_params(load_scheduler(os.path.dirname(cards_path)), card_data.get("deck"))
 
     # Ensure defaults
-    card_data.setdefault("ease_factor", 2.5)
+    card_data.setdefault("ease_factor", params["initial_ease"])
     card_data.setdefault("interval_days", 0)
     card_data.setdefault("repetitions", 0)
     card_data.setdefault("next_review", date.today().isoformat())
@@ -112,22 +417,25 @@ def append_card(cards_path: str, card_data: dict) -> str:
 
     data["cards"].append(card_data)
     save_json(cards_path, data)
+    mark_topics_stale(os.path.dirname(cards_path), cards=(card_data.get("deck"),))
     return card_id
 
 
 def update_card_after_review(cards_path: str, card_id: str, quality: int,
                               session_id: str = "", context: str = "", notes: str = "") -> dict:
-    """Update a card after review using SM-2. Returns updated card."""
+    """Update a card after review using the project's scheduler. Returns updated card."""
     data = load_json(cards_path)
     today_str = date.today().isoformat()
     now_str = datetime.now().isoformat(timespec="seconds")
+    config = load_scheduler(os.path.dirname(cards_path))
+    schedule = get_scheduler(config)
 
     for card in data["cards"]:
         if card["id"] == card_id:
-            # Apply SM-2
-            updates = sm2_update(
+            # Apply the project's scheduler (SM-2 unless fitted otherwise)
+            updates = schedule(
                 quality, card["ease_factor"], card["interval_days"],
-                card["repetitions"], today_str
+                card["repetitions"], today_str, scheduler_params(config, card.get("deck"))
             )
             card.update(updates)
             card["last_reviewed"] = now_str
@@ -140,8 +448,10 @@ def update_card_after_review(cards_path: str, card_id: str, quality: int,
                 "context": context,
                 "notes": notes,
             })
+            compact_card_history(card, data.get("history_keep", HISTORY_KEEP))
 
             save_json(cards_path, data)
+            mark_topics_stale(os.path.dirname(cards_path), cards=(card.get("deck"),))
             return card
 
     raise ValueError(f"Card {card_id} not found")
@@ -162,6 +472,7 @@ def append_session(sessions_path: str, session_data: dict) -> str:
 
 def append_exercise(exercises_path: str, exercise_data: dict) -> str:
     """Append an exercise record. Returns assigned ID."""
+    previous_source = _exercise_source(exercises_path)
     data = load_json(exercises_path)
     if "exercises" not in data:
         data["exercises"] = []
@@ -179,9 +490,161 @@ def append_exercise(exercises_path: str, exercise_data: dict) -> str:
 
     data["exercises"].append(exercise_data)
     save_json(exercises_path, data)
+
+    # Fold into the stats cache only if it describes the file as it was just read;
+    # after a hand edit to exercises.json, rebuild from the data already in memory
+    cache_path = _exercise_stats_path(exercises_path)
+    cache = load_json(cache_path)
+    if (cache and cache.get("source") == previous_source
+            and cache.get("version") == EXERCISE_STATS_VERSION):
+        _fold_exercise(cache, exercise_data)
+        cache["count"] += 1
+        cache["last_id"] = exercise_id
+    else:
+        cache = build_exercise_stats(data)
+    cache["source"] = _exercise_source(exercises_path)
+    save_json(cache_path, cache)
+
+    if exercise_data.get("completed"):
+        mark_topics_stale(os.path.dirname(exercises_path), exercises=(exercise_data.get("topic"),))
     return exercise_id
 
 
+# Upper bounds of time-taken / time-budget buckets in exercise stats.
+TIME_RATIO_BUCKETS = (0.5, 1.0, 1.5)
+# Bumped when the cached accumulators change shape, so old caches are rebuilt.
+EXERCISE_STATS_VERSION = 2
+
+
+def _empty_exercise_acc() -> dict:
+    return {
+        "total": 0,
+        "completed": 0,
+        "attempts": 0,
+        "with_attempts": 0,
+        "timed": 0,
+        "with_time": 0,
+        "over_budget": 0,
+        "time_ratio_sum": 0.0,
+        "time_ratio_buckets": [0] * (len(TIME_RATIO_BUCKETS) + 1),
+    }
+
+
+def _fold_exercise(stats: dict, exercise: dict) -> None:
+    """Fold one exercise into the overall, per-pattern and per-topic accumulators."""
+    groups = [stats["overall"], stats["topics"].setdefault(exercise.get("topic") or "unknown",
+                                                            _empty_exercise_acc())]
+    if exercise.get("pattern"):
+        groups.append(stats["patterns"].setdefault(exercise["pattern"], _empty_exercise_acc()))
+
+    # Interview budget when set, otherwise the exercise's own expected time
+    budget = exercise.get("interview_time_budget") or exercise.get("expected_time_minutes")
+    taken = exercise.get("time_taken_minutes")
+    ratio = taken / budget if exercise.get("completed") and taken and budget else None
+    if ratio is not None:
+        bucket = next((i for i, bound in enumerate(TIME_RATIO_BUCKETS) if ratio <= bound),
+                      len(TIME_RATIO_BUCKETS))
+
+    for acc in groups:
+        acc["total"] += 1
+        acc["completed"] += bool(exercise.get("completed"))
+        if exercise.get("attempts") is not None:
+            acc["attempts"] += exercise["attempts"]
+            acc["with_attempts"] += 1
+        acc["timed"] += bool(exercise.get("timed"))
+        if ratio is not None:
+            acc["with_time"] += 1
+            acc["over_budget"] += ratio > 1.0
+            acc["time_ratio_sum"] += ratio
+            acc["time_ratio_buckets"][bucket] += 1
+
+
+def _exercise_source(exercises_path: str) -> dict | None:
+    if not os.path.exists(exercises_path):
+        return None
+    st = os.stat(exercises_path)
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def _exercise_stats_path(exercises_path: str) -> str:
+    return os.path.join(os.path.dirname(exercises_path), "exercise-stats.json")
+
+
+def build_exercise_stats(exercises_data: dict) -> dict:
+    """Accumulate exercise stats in a single pass over exercises.json."""
+    exercises = exercises_data.get("exercises", [])
+    stats = {
+        "version": EXERCISE_STATS_VERSION,
+        "count": len(exercises),
+        "last_id": exercises[-1]["id"] if exercises else None,
+        "overall": _empty_exercise_acc(),
+        "patterns": {},
+        "topics": {},
+    }
+    for e in exercises:
+        _fold_exercise(stats, e)
+    return stats
+
+
+def load_exercise_stats(exercises_path: str) -> dict:
+    """Cached exercise accumulators, rebuilt only if exercises.json changed underneath.
+
+    The cache (data/exercise-stats.json) records the size and mtime of the
+    exercises.json it describes; append_exercise keeps it current.
+    """
+    cache_path = _exercise_stats_path(exercises_path)
+    source = _exercise_source(exercises_path)
+    cache = load_json(cache_path)
+    if cache and cache.get("source") == source and cache.get("version") == EXERCISE_STATS_VERSION:
+        return cache
+
+    stats = build_exercise_stats(load_json(exercises_path))
+    if source is not None:
+        stats["source"] = source
+        save_json(cache_path, stats)
+    return stats
+
+
+def _summarize_exercise_acc(acc: dict) -> dict:
+    with_time = acc["with_time"]
+    with_attempts = acc["with_attempts"]
+    labels = [f"<={b}" for b in TIME_RATIO_BUCKETS] + [f">{TIME_RATIO_BUCKETS[-1]}"]
+    return {
+        "total": acc["total"],
+        "completed": acc["completed"],
+        "solve_rate_pct": round(acc["completed"] / acc["total"] * 100, 1) if acc["total"] else 0,
+        "avg_attempts": round(acc["attempts"] / with_attempts, 2) if with_attempts else None,
+        "timed": acc["timed"],
+        "avg_time_ratio": round(acc["time_ratio_sum"] / with_time, 2) if with_time else None,
+        "over_budget_pct": round(acc["over_budget"] / with_time * 100, 1) if with_time else None,
+        "time_ratio_distribution": dict(zip(labels, acc["time_ratio_buckets"])),
+    }
+
+
+def exercise_stats(exercises_path: str, weakest: int = 5) -> dict:
+    """Per-pattern and per-topic solve rates, time-vs-budget and weakest patterns.
+
+    Time ratio is time_taken_minutes over interview_time_budget (or
+    expected_time_minutes), for completed exercises with both recorded.
+    Weakest patterns rank by solve rate, then by average time ratio.
+    """
+    stats = load_exercise_stats(exercises_path)
+    patterns = {name: _summarize_exercise_acc(acc) for name, acc in sorted(stats["patterns"].items())}
+    ranked = sorted(
+        patterns.items(),
+        key=lambda item: (item[1]["solve_rate_pct"], -(item[1]["avg_time_ratio"] or 0), -item[1]["total"]),
+    )
+    return {
+        "overall": _summarize_exercise_acc(stats["overall"]),
+        "patterns": patterns,
+        "topics": {name: _summarize_exercise_acc(acc) for name, acc in sorted(stats["topics"].items())},
+        "weakest_patterns": [
+            {"pattern": name, "solve_rate_pct": p["solve_rate_pct"], "avg_time_ratio": p["avg_time_ratio"]}
+            for name, p in ranked[:weakest]
+        ],
+    }
+
+
 def card_stats(cards_data: dict) -> dict:
     """Compute card statistics."""
     cards = cards_data.get("cards", [])
@@ -189,14 +652,13 @@ def card_stats(cards_data: dict) -> dict:
 
     total = len(cards)
     due = len([c for c in cards if c["next_review"] <= today_str])
-    mature = len([c for c in cards
-                  if c["ease_factor"] > 2.5 and c["interval_days"] > 21 and c["repetitions"] >= 3])
+    mature = len([c for c in cards if is_mature(c)])
     new = len([c for c in cards if c["repetitions"] == 0])
 
     # Average ease
     avg_ease = sum(c["ease_factor"] for c in cards) / total if total else 0
 
-    # Accuracy from recent reviews (last 50)
+    # Accuracy from recent reviews (last 50 raw entries; compacted ones are older)
     all_reviews = []
     for c in cards:
         for r in c.get("review_history", []):
@@ -205,6 +667,17 @@ def card_stats(cards_data: dict) -> dict:
     recent = all_reviews[:50]
     accuracy = (sum(1 for r in recent if r["quality"] >= 3) / len(recent) * 100) if recent else 0
 
+    # Lifetime totals from compacted summaries plus raw history
+    total_reviews = 0
+    total_correct = 0
+    lapses = 0
+    for c in cards:
+        agg = history_aggregate(c)
+        total_reviews += agg["reviews"]
+        total_correct += agg["correct"]
+        lapses += agg["lapses"]
+    lifetime_accuracy = (total_correct / total_reviews * 100) if total_reviews else 0
+
     return {
         "total": total,
         "due_today": due,
@@ -212,6 +685,9 @@ def card_stats(cards_data: dict) -> dict:
         "new": new,
         "average_ease": round(avg_ease, 2),
         "recent_accuracy_pct": round(accuracy, 1),
+        "total_reviews": total_reviews,
+        "lifetime_accuracy_pct": round(lifetime_accuracy, 1),
+        "lapses": lapses,
     }
 
 
@@ -230,8 +706,7 @@ def card_progress(cards_data: dict) -> dict:
         result[deck] = {
             "total": len(deck_cards),
             "due": len([c for c in deck_cards if c["next_review"] <= today_str]),
-            "mature": len([c for c in deck_cards
-                           if c["ease_factor"] > 2.5 and c["interval_days"] > 21 and c["repetitions"] >= 3]),
+            "mature": len([c for c in deck_cards if is_mature(c)]),
             "struggling": len([c for c in deck_cards if c["ease_factor"] < 1.5]),
             "new": len([c for c in deck_cards if c["repetitions"] == 0]),
         }
@@ -303,6 +778,29 @@ def main():
                 return
         print(f"{sys.argv[3]}001")
 
+    elif cmd == "compact-history":
+        keep = int(sys.argv[3]) if len(sys.argv) > 3 else None
+        try:
+            result = compact_history(sys.argv[2], keep)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(json.dumps(result, indent=2))
+
+    elif cmd == "optimize":
+        from sr_optimize import optimize_project
+        retention = float(sys.argv[3]) if len(sys.argv) > 3 else 0.9
+        result = optimize_project(sys.argv[2], retention)
+        print(json.dumps(result, indent=2))
+
+    elif cmd == "refresh-topics":
+        result = refresh_topics(os.path.join(sys.argv[2], "data"), full="--all" in sys.argv[3:])
+        print(json.dumps(result, indent=2))
+
+    elif cmd == "exercise-stats":
+        stats = exercise_stats(sys.argv[2])
+        print(json.dumps(stats, indent=2))
+
     elif cmd == "sm2":
         # sm2 <quality> <ease_factor> <interval_days> <repetitions>
         quality = int(sys.argv[2])
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Simulate review backlog under what-if scenarios for plan triage.
+Zero external dependencies — stdlib only.
+
+Usage:
+    uv run python3 ~/.claude/skills/study-plan/scripts/simulate.py <project-dir> <scenarios> [days]
+
+<scenarios> is a JSON list (inline, or a path to a .json file) of:
+    {"name": "skip 3", "skip_days": 3, "daily_cap": 40, "paused_decks": ["dp"], "days": 21}
+
+    skip_days     Days from today with no reviews (default 0)
+    daily_cap     Max reviews per study day, null for no cap (default null)
+    paused_decks  Existing decks never reviewed; their due cards count as backlog (default [])
+    days          Horizon in days (default [days] argument, else 14)
+
+Each scenario replays the current deck day by day: due cards are reviewed
+overdue-first then lowest ease (as due-cards orders them), graded correct with
+the card's rolling accuracy (or the sessions.json accuracy for new cards) and
+rescheduled with the project's SM-2 parameters. Scenarios run in parallel
+across worker processes. Reports end-of-day backlog per deck.
+"""
+
+import heapq
+import json
+import os
+import random
+import sys
+from bisect import bisect_right
+from datetime import date
+
+from json_helpers import history_aggregate, load_json, load_scheduler, scheduler_params, sm2_step
+
+DEFAULT_DAYS = 14
+# Recall probability when neither the card nor sessions.json has any history.
+DEFAULT_ACCURACY = 0.85
+# Simulated grades for a correct / incorrect recall.
+CORRECT_QUALITY = 4
+INCORRECT_QUALITY = 2
+
+# Per-worker deck snapshot, set once by _init_worker rather than pickled per scenario
+_CARDS: list = []
+_PARAMS: dict = {}
+
+
+def _init_worker(cards: list, params: dict) -> None:
+    global _CARDS, _PARAMS
+    _CARDS = cards
+    _PARAMS = params
+
+
+def snapshot_cards(project_dir: str) -> tuple[list, dict]:
+    """Reduce cards.json to (deck, ease, interval, reps, next_review ordinal, p_recall) tuples.
+
+    Returns (cards, per-deck scheduler params).
+    """
+    data_dir = os.path.join(project_dir, "data")
+    cards = load_json(os.path.join(data_dir, "cards.json")).get("cards", [])
+    sessions = load_json(os.path.join(data_dir, "sessions.json")).get("sessions", [])
+    config = load_scheduler(data_dir)
+
+    reviewed = sum(s.get("cards_reviewed", 0) for s in sessions)
+    correct = sum(s.get("cards_correct", 0) for s in sessions)
+    fallback = correct / reviewed if reviewed else DEFAULT_ACCURACY
+
+    snapshot = []
+    params = {}
+    for c in cards:
+        deck = c.get("deck", "unknown")
+        if deck not in params:
+            params[deck] = scheduler_params(config, deck)
+        rolling = history_aggregate(c)["rolling_accuracy"]
+        snapshot.append((
+            deck,
+            c["ease_factor"],
+            c["interval_days"],
+            c["repetitions"],
+            date.fromisoformat(c["next_review"]).toordinal(),
+            fallback if rolling is None else rolling,
+        ))
+    return snapshot, params
+
+
+def run_scenario(scenario: dict, today: int) -> dict:
+    """Simulate one scenario over the worker's card snapshot."""
+    days = scenario["days"]
+    first_study_day = today + scenario.get("skip_days", 0)
+    cap = scenario.get("daily_cap")
+    paused = set(scenario.get("paused_decks", []))
+    rng = random.Random(scenario["name"])
+
+    decks = sorted({c[0] for c in _CARDS})
+    # Heap of (next_review, ease, index), the order due-cards reviews in.
+    # Paused decks stay out of it; their due counts come from sorted dates.
+    heap = []
+    paused_due: dict[str, list] = {deck: [] for deck in paused}
+    # Cards becoming due on each day of the horizon, per deck (overdue land on day 0)
+    arrivals = [dict.fromkeys(decks, 0) for _ in range(days)]
+    states = []
+    for i, (deck, ease, interval, reps, next_review, _) in enumerate(_CARDS):
+        states.append((ease, interval, reps))
+        if deck in paused:
+            paused_due[deck].append(next_review)
+        else:
+            heap.append((next_review, ease, i))
+            offset = max(next_review - today, 0)
+            if offset < days:
+                arrivals[offset][deck] += 1
+    heapq.heapify(heap)
+    for dates in paused_due.values():
+        dates.sort()
+
+    backlog = {deck: [] for deck in decks}
+    reviews = dict.fromkeys(decks, 0)
+    due = dict.fromkeys(decks, 0)
+    for offset in range(days):
+        day = today + offset
+        for deck, arrived in arrivals[offset].items():
+            due[deck] += arrived
+
+        done = 0
+        while day >= first_study_day and heap and heap[0][0] <= day and (cap is None or done < cap):
+            _, _, i = heapq.heappop(heap)
+            deck, _, _, _, _, p_recall = _CARDS[i]
+            quality = CORRECT_QUALITY if rng.random() < p_recall else INCORRECT_QUALITY
+            ease, interval, reps = sm2_step(quality, *states[i], _PARAMS[deck])
+            states[i] = (ease, interval, reps)
+            # A zero interval (e.g. a hand-edited card) would be due again the same day
+            gap = max(1, interval)
+            heapq.heappush(heap, (day + gap, ease, i))
+            if offset + gap < days:
+                arrivals[offset + gap][deck] += 1
+            due[deck] -= 1
+            reviews[deck] += 1
+            done += 1
+
+        # Whatever is still due at the end of the day is backlog
+        for deck, dates in paused_due.items():
+            due[deck] = bisect_right(dates, day)
+        for deck in decks:
+            backlog[deck].append(due[deck])
+
+    total = [sum(backlog[deck][d] for deck in decks) for d in range(days)]
+    return {
+        "name": scenario["name"],
+        "days": days,
+        "reviews": sum(reviews.values()),
+        "final_backlog": total[-1] if total else 0,
+        "peak_backlog": max(total, default=0),
+        "backlog": total,
+        "backlog_by_deck": backlog,
+        "reviews_by_deck": reviews,
+        # Decks holding the most backlog at the end, then costing the most reviews
+        "drop_candidates": sorted(
+            (d for d in decks if d not in paused),
+            key=lambda d: (-backlog[d][-1], -reviews[d]),
+        )[:3],
+    }
+
+
+def _run(args: tuple) -> dict:
+    return run_scenario(*args)
+
+
+def simulate(project_dir: str, scenarios: list, days: int = DEFAULT_DAYS,
+             workers: int | None = None) -> list:
+    """Run what-if scenarios over a project's deck, in parallel where it pays off."""
+    cards, params = snapshot_cards(project_dir)
+    today = date.today().toordinal()
+    scenarios = [
+        {"name": f"scenario-{i + 1}", "days": days, **scenario}
+        for i, scenario in enumerate(scenarios)
+    ]
+    decks = {card[0] for card in cards}
+    for scenario in scenarios:
+        if scenario["days"] < 1:
+            raise ValueError(f"Scenario {scenario['name']} needs at least 1 day")
+        unknown = sorted(set(scenario.get("paused_decks", [])) - decks)
+        if unknown:
+            raise ValueError(f"Scenario {scenario['name']} pauses unknown decks: {', '.join(unknown)}")
+
+    workers = min(workers or os.cpu_count() or 1, len(scenarios))
+    if workers <= 1:
+        _init_worker(cards, params)
+        return [run_scenario(scenario, today) for scenario in scenarios]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(cards, params)) as pool:
+        return list(pool.map(_run, [(scenario, today) for scenario in scenarios]))
+
+
+def main():
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+
+    arg = sys.argv[2]
+    scenarios = load_json(arg) if arg.endswith(".json") else json.loads(arg)
+    days = int(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_DAYS
+    try:
+        results = simulate(sys.argv[1], scenarios, days)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Fit per-deck SM-2 parameters against logged review history.
+Zero external dependencies — stdlib only.
+
+Usage:
+    uv run python3 ~/.claude/skills/study-plan/scripts/sr_optimize.py <project-dir> [retention]
+
+Every review with a known preceding review is an observation: elapsed days t
+since the previous review, and whether it was recalled (quality >= 3). The
+interval SM-2 would have scheduled at the previous review is I, and recall is
+modelled as retention ** (t / I) — a perfectly calibrated scheduler recalls at
+the target retention exactly when a card comes due. Parameters are chosen to
+minimise the log loss of that model over all observations.
+
+Reviews are flattened once into arrays; each loss evaluation is a handful of
+C-level map/accumulate passes over them rather than a per-card replay. The
+coarse search runs on a card sample and the final step on every review, so
+hundreds of thousands of reviews fit in seconds. Interval rounding and the
+1.3 ease floor are applied to the ease, not to each intermediate step, which
+matches SM-2 except for cards that hit the floor and later recover.
+
+Results are written to <project-dir>/data/scheduler.json, which
+json_helpers.update_card_after_review reads on every review.
+"""
+
+import json
+import math
+import sys
+from collections import Counter
+from datetime import date, datetime
+from itertools import accumulate, repeat
+from operator import add, mul, neg, sub
+from pathlib import Path
+
+from json_helpers import SM2_DEFAULTS, load_json, save_json
+
+# Decks with fewer observations than this use the project-wide fit.
+MIN_DECK_REVIEWS = 200
+# Approximate reviews per sample used for the coarse parameter search.
+SAMPLE_REVIEWS = 25_000
+# Same-day re-reviews still carry some forgetting signal.
+MIN_ELAPSED_DAYS = 0.25
+# Upper clamp on ln(r) * t / I in miss terms, so log(1 - r ** (t / I)) stays
+# finite when t / I underflows to 0 (a miss after a long correct streak).
+MAX_MISS_EXPONENT = -1e-300
+
+INTERVAL_BOUNDS = {
+    "lapse_interval": range(1, 8),
+    "first_interval": range(1, 11),
+}
+# Jointly fitted parameters: (name, lower, upper, initial step)
+JOINT_PARAMS = [
+    ("second_interval", 2.0, 30.0, 2.0),
+    ("initial_ease", 1.3, 4.0, 0.2),
+    ("ease_bonus", 0.0, 0.3, 0.04),
+    ("ease_linear", 0.0, 0.3, 0.04),
+    ("ease_quadratic", 0.0, 0.1, 0.01),
+]
+
+
+def _new_observations() -> dict:
+    """Flat observation arrays for one deck (or the whole project)."""
+    return {
+        # Constant-interval groups: Counter of elapsed days, split by outcome
+        "lapse": (Counter(), Counter()),
+        "first": (Counter(), Counter()),
+        "second": (Counter(), Counter()),
+        # Mature observations: elapsed days plus the [start, end) slice of
+        # `steps` whose eases multiplied second_interval into I
+        "mature_hit": ([], [], []),
+        "mature_miss": ([], [], []),
+        "steps": [],
+        # Distinct (reviews, sum d, sum d^2) ease inputs, as a lookup and as columns
+        "triples": {},
+        "triple_cols": ([], [], []),
+        "count": 0,
+    }
+
+
+def _ordinal(iso: str) -> int:
+    return date.fromisoformat(iso[:10]).toordinal()
+
+
+def _collect_card(card: dict, obs: dict) -> bool:
+    """Add one card's reviews to `obs`. Returns False if nothing was usable.
+
+    A compacted card resumes from its history_summary: quality counts give the
+    ease inputs, and the stored streak and mature run give the repetition
+    state. Summaries written before streak tracking only know the streak
+    again once the retained history contains a lapse (or the summary ended on one).
+    """
+    steps = obs["steps"]
+    triples = obs["triples"]
+    cols = obs["triple_cols"]
+
+    def step(triple: tuple) -> None:
+        if triple not in triples:
+            triples[triple] = len(triples)
+            for col, value in zip(cols, triple):
+                col.append(value)
+        steps.append(triples[triple])
+
+    run_start = len(steps)
+    summary = card.get("history_summary")
+    if summary:
+        counts = summary["quality_counts"]
+        n = summary["reviews"]
+        d_sum = sum(c * (5 - q) for q, c in enumerate(counts))
+        d2_sum = sum(c * (5 - q) ** 2 for q, c in enumerate(counts))
+        last = summary["last_quality"]
+        reps = summary.get("streak", 0 if last is not None and last < 3 else None)
+        if reps is not None and reps >= 2:
+            for triple in summary.get("mature_run", []):
+                step(tuple(triple))
+        prev = _ordinal(summary["last_date"]) if summary["last_date"] else None
+    else:
+        n = d_sum = d2_sum = 0
+        reps = 0
+        prev = None
+    used = False
+
+    for review in card.get("review_history", []):
+        quality = review["quality"]
+        hit = quality >= 3
+        day = _ordinal(review["date"])
+
+        if prev is not None and reps is not None:
+            t = max(day - prev, MIN_ELAPSED_DAYS)
+            if reps >= 3:
+                group = obs["mature_hit"] if hit else obs["mature_miss"]
+                group[0].append(t)
+                group[1].append(run_start)
+                group[2].append(len(steps))
+            else:
+                key = ("lapse", "first", "second")[reps]
+                obs[key][0 if hit else 1][t] += 1
+            obs["count"] += 1
+            used = True
+
+        if hit:
+            if reps is not None:
+                if reps >= 2:
+                    # Interval grows by the ease *before* this review's update
+                    step((n, d_sum, d2_sum))
+                reps += 1
+                if reps == 2:
+                    run_start = len(steps)
+        else:
+            reps = 0
+
+        d = 5 - quality
+        n += 1
+        d_sum += d
+        d2_sum += d * d
+        prev = day
+
+    return used
+
+
+def _constant_loss(group: tuple, interval: float, ln_r: float) -> float:
+    """Log loss for observations that all share one scheduled interval."""
+    hits, misses = group
+    loss = -ln_r * sum(t * c for t, c in hits.items()) / interval
+    for t, c in misses.items():
+        loss -= c * math.log(-math.expm1(min(ln_r * t / interval, MAX_MISS_EXPONENT)))
+    return loss
+
+
+def _mature_loss(obs: dict, params: dict, ln_r: float) -> float:
+    """Log loss for mature observations, evaluated as batched array passes."""
+    # ease = initial + bonus * n - linear * sum(d) - quadratic * sum(d^2), floored
+    n, d_sum, d2_sum = obs["triple_cols"]
+    ease = map(add, map(mul, n, repeat(params["ease_bonus"])), repeat(params["initial_ease"]))
+    ease = map(sub, ease, map(mul, d_sum, repeat(params["ease_linear"])))
+    ease = map(sub, ease, map(mul, d2_sum, repeat(params["ease_quadratic"])))
+    log_ease = list(map(math.log, map(max, ease, repeat(params["min_ease"]))))
+    prefix = list(accumulate(map(log_ease.__getitem__, obs["steps"]), initial=0.0))
+    at = prefix.__getitem__
+    scale = ln_r / params["second_interval"]
+
+    # hits: -ln(r ** (t / I)) = -ln_r * t * exp(-S) / second
+    t, start, end = obs["mature_hit"]
+    inv = map(math.exp, map(neg, map(sub, map(at, end), map(at, start))))
+    loss = -scale * sum(map(mul, t, inv))
+
+    # misses: -ln(1 - r ** (t / I))
+    t, start, end = obs["mature_miss"]
+    inv = map(math.exp, map(neg, map(sub, map(at, end), map(at, start))))
+    x = map(min, map(mul, map(mul, t, inv), repeat(scale)), repeat(MAX_MISS_EXPONENT))
+    loss -= sum(map(math.log, map(neg, map(math.expm1, x))))
+    return loss
+
+
+def _joint_loss(obs: dict, params: dict, ln_r: float) -> float:
+    return (_constant_loss(obs["second"], params["second_interval"], ln_r)
+            + _mature_loss(obs, params, ln_r))
+
+
+def total_loss(obs: dict, params: dict, ln_r: float) -> float:
+    """Mean log loss per observation under `params`."""
+    if not obs["count"]:
+        return 0.0
+    loss = (_constant_loss(obs["lapse"], params["lapse_interval"], ln_r)
+            + _constant_loss(obs["first"], params["first_interval"], ln_r)
+            + _joint_loss(obs, params, ln_r))
+    return loss / obs["count"]
+
+
+def _pattern_search(obs: dict, params: dict, ln_r: float, steps: dict, rounds: int,
+                    max_sweeps: int | None = None) -> dict:
+    """Coordinate pattern search over JOINT_PARAMS, halving steps each round."""
+    best = _joint_loss(obs, params, ln_r)
+    for _ in range(rounds):
+        improved = True
+        sweeps = 0
+        while improved and sweeps != max_sweeps:
+            improved = False
+            sweeps += 1
+            for name, lower, upper, _ in JOINT_PARAMS:
+                for direction in (1, -1):
+                    value = min(upper, max(lower, params[name] + direction * steps[name]))
+                    if value == params[name]:
+                        continue
+                    trial = {**params, name: value}
+                    loss = _joint_loss(obs, trial, ln_r)
+                    if loss < best:
+                        params, best, improved = trial, loss, True
+                        break
+        steps = {name: step / 2 for name, step in steps.items()}
+    return params
+
+
+def fit_params(obs: dict, retention: float = 0.9, start: dict | None = None,
+               sample: dict | None = None) -> dict:
+    """Fit SM-2 parameters to one set of observations.
+
+    With a `sample` (observations from a subset of the same cards) the coarse
+    search runs on the sample and a single sweep at the finest step is checked
+    against the full set.
+    """
+    ln_r = math.log(retention)
+    params = {**SM2_DEFAULTS, **(start or {})}
+
+    # Lapse and first intervals only affect their own groups: scan directly
+    for name, candidates in INTERVAL_BOUNDS.items():
+        group = obs["lapse" if name == "lapse_interval" else "first"]
+        if sum(group[0].values()) + sum(group[1].values()):
+            params[name] = min(candidates, key=lambda v: _constant_loss(group, v, ln_r))
+
+    # The rest interact through the mature intervals: pattern search. A fitted
+    # start (the project-wide fit, for a deck) skips the two coarsest rounds.
+    params["second_interval"] = float(params["second_interval"])
+    rounds = 6 if start is None else 4
+    steps = {name: step / 2 ** (6 - rounds) for name, _, _, step in JOINT_PARAMS}
+    if sample is not None:
+        params = _pattern_search(sample, params, ln_r, steps, rounds - 1)
+        steps = {name: step / 2 ** (rounds - 1) for name, step in steps.items()}
+        params = _pattern_search(obs, params, ln_r, steps, 1, max_sweeps=1)
+    else:
+        params = _pattern_search(obs, params, ln_r, steps, rounds)
+
+    params["second_interval"] = max(2, round(params["second_interval"]))
+    for name in ("initial_ease", "ease_bonus", "ease_linear", "ease_quadratic"):
+        params[name] = round(params[name], 4)
+    return params
+
+
+def collect_observations(cards_data: dict) -> tuple[dict, dict, dict, int]:
+    """Flatten review history into per-deck observations.
+
+    Returns (deck_obs, deck_samples, project_sample, skipped_cards). Samples
+    take every k-th card so each holds roughly SAMPLE_REVIEWS reviews.
+    """
+    cards = cards_data.get("cards", [])
+    deck_reviews = Counter()
+    for card in cards:
+        deck_reviews[card.get("deck", "unknown")] += len(card.get("review_history", []))
+    total = sum(deck_reviews.values())
+    project_stride = max(1, -(-total // SAMPLE_REVIEWS))
+
+    deck_obs: dict[str, dict] = {}
+    deck_samples: dict[str, dict] = {}
+    deck_seen = Counter()
+    project_sample = _new_observations()
+    skipped = 0
+    for i, card in enumerate(cards):
+        deck = card.get("deck", "unknown")
+        if deck not in deck_obs:
+            deck_obs[deck] = _new_observations()
+            deck_samples[deck] = _new_observations()
+        obs = deck_obs[deck]
+        sample = deck_samples[deck]
+        # Cards compacted before streak tracking whose retained history never re-established it
+        if not _collect_card(card, obs) and card.get("history_summary") and card.get("review_history"):
+            skipped += 1
+        if deck_seen[deck] % max(1, -(-deck_reviews[deck] // SAMPLE_REVIEWS)) == 0:
+            _collect_card(card, sample)
+        if i % project_stride == 0:
+            _collect_card(card, project_sample)
+        deck_seen[deck] += 1
+    return deck_obs, deck_samples, project_sample, skipped
+
+
+def optimize_project(project_dir: str, retention: float = 0.9) -> dict:
+    """Fit parameters for a project and store them in data/scheduler.json."""
+    data_dir = Path(project_dir) / "data"
+    cards = load_json(str(data_dir / "cards.json"))
+    deck_obs, deck_samples, project_sample, skipped = collect_observations(cards)
+    ln_r = math.log(retention)
+
+    # Project-wide fit is the starting point for decks and the fallback for small ones
+    default = fit_params(project_sample, retention)
+    decks = {}
+    report_decks = {}
+    count = loss_before = loss_after = 0.0
+    for deck, obs in sorted(deck_obs.items()):
+        fitted = default
+        if obs["count"] >= MIN_DECK_REVIEWS:
+            fitted = decks[deck] = fit_params(obs, retention, default, deck_samples[deck])
+        before = total_loss(obs, SM2_DEFAULTS, ln_r)
+        after = total_loss(obs, fitted, ln_r)
+        count += obs["count"]
+        loss_before += before * obs["count"]
+        loss_after += after * obs["count"]
+        if deck in decks:
+            report_decks[deck] = {
+                "reviews": obs["count"],
+                "log_loss_before": round(before, 4),
+                "log_loss_after": round(after, 4),
+                "params": fitted,
+            }
+
+    save_json(str(data_dir / "scheduler.json"), {
+        "scheduler": "sm2",
+        "retention": retention,
+        "fitted": datetime.now().isoformat(timespec="seconds"),
+        "reviews": int(count),
+        "default": default,
+        "decks": decks,
+    })
+    return {
+        "retention": retention,
+        "reviews": int(count),
+        "skipped_cards": skipped,
+        "log_loss_before": round(loss_before / count, 4) if count else 0,
+        "log_loss_after": round(loss_after / count, 4) if count else 0,
+        "default": default,
+        "decks": report_decks,
+    }
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    retention = float(sys.argv[2]) if len(sys.argv) > 2 else 0.9
+    result = optimize_project(sys.argv[1], retention)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the study-plan and study-session scripts.
+Zero external dependencies — stdlib only.
+
+Usage:
+    python3 ~/.claude/skills/study-plan/scripts/studykit.py <command> <args...>
+    python3 studykit.pyz <command> <args...>
+
+Each command imports only the module that implements it, and imported
+modules are loaded from cached bytecode, so small queries like `due-cards`
+start faster than running json_helpers.py directly (a script run as __main__
+is recompiled on every call). No uv needed.
+
+Commands:
+    json_helpers:     load, due-cards, add-card, update-card, add-session, add-exercise,
+                      stats, progress, next-id, compact-history, optimize, refresh-topics,
+                      exercise-stats, sm2
+    sr_review:        overdue, review, summary
+    session_summary:  session-stats, streak, timing, brief, render-report
+    simulate:         simulate <project-dir> <scenarios> [days]
+    init_study_project: init --name <slug> --location <path> --mode <mode> [...]
+
+    compile           Precompile both skills' scripts into __pycache__ (run after install/update)
+    build [out.pyz]   Package all scripts as a zipapp with precompiled bytecode
+"""
+
+import os
+import sys
+
+# Command -> (module, command name within that module's own CLI)
+COMMANDS = {
+    "load": ("json_helpers", "load"),
+    "due-cards": ("json_helpers", "due-cards"),
+    "add-card": ("json_helpers", "add-card"),
+    "update-card": ("json_helpers", "update-card"),
+    "add-session": ("json_helpers", "add-session"),
+    "add-exercise": ("json_helpers", "add-exercise"),
+    "stats": ("json_helpers", "stats"),
+    "progress": ("json_helpers", "progress"),
+    "next-id": ("json_helpers", "next-id"),
+    "compact-history": ("json_helpers", "compact-history"),
+    "optimize": ("json_helpers", "optimize"),
+    "refresh-topics": ("json_helpers", "refresh-topics"),
+    "exercise-stats": ("json_helpers", "exercise-stats"),
+    "sm2": ("json_helpers", "sm2"),
+    "overdue": ("sr_review", "overdue"),
+    "review": ("sr_review", "review"),
+    "summary": ("sr_review", "summary"),
+    "session-stats": ("session_summary", "stats"),
+    "streak": ("session_summary", "streak"),
+    "timing": ("session_summary", "timing"),
+    "brief": ("session_summary", "brief"),
+    "render-report": ("session_summary", "render-report"),
+    "simulate": ("simulate", None),
+    "init": ("init_study_project", None),
+}
+
+HERE = os.path.dirname(os.path.realpath(__file__))
+# Sibling skill's scripts in a checkout; inside a zipapp everything is flat
+SESSION_SCRIPTS = os.path.join(os.path.dirname(os.path.dirname(HERE)), "study-session", "scripts")
+
+
+def compile_scripts() -> None:
+    """Write __pycache__ bytecode for both skills' scripts, even under PYTHONDONTWRITEBYTECODE."""
+    import compileall
+
+    for src_dir in (HERE, SESSION_SCRIPTS):
+        if os.path.isdir(src_dir):
+            compileall.compile_dir(src_dir, maxlevels=0, quiet=1)
+
+
+def build(target: str) -> None:
+    """Write a zipapp of both skills' scripts with unchecked-hash bytecode."""
+    import glob
+    import py_compile
+    import shutil
+    import tempfile
+    import zipapp
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for src_dir in (HERE, SESSION_SCRIPTS):
+            for src in glob.glob(os.path.join(src_dir, "*.py")):
+                dst = os.path.join(tmp, os.path.basename(src))
+                shutil.copy2(src, dst)
+                # Legacy module.pyc next to module.py is what zipimport looks for
+                py_compile.compile(dst, cfile=dst + "c", dfile=os.path.basename(src), doraise=True,
+                                   invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+        zipapp.create_archive(tmp, target, interpreter="/usr/bin/env python3", main="studykit:main")
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in COMMANDS and sys.argv[1] not in ("build", "compile"):
+        print(__doc__)
+        sys.exit(1)
+
+    cmd = sys.argv[1]
+    if cmd == "compile":
+        compile_scripts()
+        print("Compiled scripts to __pycache__")
+        return
+
+    if cmd == "build":
+        target = sys.argv[2] if len(sys.argv) > 2 else "studykit.pyz"
+        build(target)
+        print(f"Built {target}")
+        return
+
+    if os.path.isdir(SESSION_SCRIPTS) and SESSION_SCRIPTS not in sys.path:
+        sys.path.insert(1, SESSION_SCRIPTS)
+
+    module_name, sub = COMMANDS[cmd]
+    module = __import__(module_name)
+    # Hand over to the module's own CLI as if it had been run directly
+    sys.argv = [module.__file__] + ([sub] if sub else []) + sys.argv[2:]
+    module.main()
+
+
+if __name__ == "__main__":
+    main()
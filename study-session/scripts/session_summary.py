@@ -7,17 +7,22 @@ Usage:
     uv run python3 ~/.claude/skills/study-session/scripts/session_summary.py streak <sessions.json>
     uv run python3 ~/.claude/skills/study-session/scripts/session_summary.py timing <sessions.json>
     uv run python3 ~/.claude/skills/study-session/scripts/session_summary.py brief <project-dir>
+    uv run python3 ~/.claude/skills/study-session/scripts/session_summary.py render-report <project-dir>
 """
 
 import json
+import re
 import sys
 from datetime import date, timedelta
 from pathlib import Path
 
-# Import shared helpers
-HELPERS_PATH = Path.home() / ".claude" / "skills" / "study-plan" / "scripts"
-sys.path.insert(0, str(HELPERS_PATH))
-from json_helpers import load_json, query_due_cards, card_stats
+# Import shared helpers (already on sys.path when run via studykit)
+try:
+    from json_helpers import load_json, save_json, query_due_cards, card_stats, exercise_stats, is_mature, refresh_topics
+except ImportError:
+    HELPERS_PATH = Path.home() / ".claude" / "skills" / "study-plan" / "scripts"
+    sys.path.insert(0, str(HELPERS_PATH))
+    from json_helpers import load_json, save_json, query_due_cards, card_stats, exercise_stats, is_mature, refresh_topics
 
 
 def session_stats(sessions_data: dict) -> dict:
@@ -134,7 +139,6 @@ def session_brief(project_dir: str) -> dict:
     # Load all data
     sessions = load_json(str(p / "data" / "sessions.json"))
     cards = load_json(str(p / "data" / "cards.json"))
-    exercises = load_json(str(p / "data" / "exercises.json"))
     topics = load_json(str(p / "data" / "topics.json"))
 
     # Session stats
@@ -146,9 +150,8 @@ def session_brief(project_dir: str) -> dict:
     c_stats = card_stats(cards)
     due = query_due_cards(cards)
 
-    # Exercise stats
-    ex_completed = len([e for e in exercises.get("exercises", []) if e.get("completed")])
-    ex_total = len(exercises.get("exercises", []))
+    # Exercise stats (cached; only rescans exercises.json if it changed outside add-exercise)
+    ex_stats = exercise_stats(str(p / "data" / "exercises.json"), weakest=3)
 
     return {
         "session": stats,
@@ -156,12 +159,207 @@ def session_brief(project_dir: str) -> dict:
         "timing": timing,
         "cards": c_stats,
         "due_cards_count": len(due),
-        "exercises_completed": ex_completed,
-        "exercises_total": ex_total,
+        "exercises_completed": ex_stats["overall"]["completed"],
+        "exercises_total": ex_stats["overall"]["total"],
+        "weakest_patterns": ex_stats["weakest_patterns"],
         "topics_count": len(topics.get("topics", [])),
     }
 
 
+# progress-report.md section -> data files it is rendered from
+REPORT_SECTIONS = {
+    "Current Status": ("sessions", "cards", "exercises", "topics"),
+    "Session Log": ("sessions",),
+    "Topic Mastery": ("topics", "exercises"),
+}
+
+
+def _split_sections(text: str) -> tuple[list, dict, list]:
+    """Split markdown into (preamble lines, {heading: body lines}, heading order)."""
+    preamble: list[str] = []
+    sections: dict[str, list] = {}
+    order: list[str] = []
+    current = preamble
+    for line in text.splitlines():
+        if line.startswith("## "):
+            heading = line[3:].strip()
+            order.append(heading)
+            current = sections[heading] = []
+        else:
+            current.append(line)
+    return preamble, sections, order
+
+
+def _cell(value) -> str:
+    return "" if value is None else str(value).replace("|", "\\|").replace("\n", " ")
+
+
+def _table_end(body: list) -> int:
+    """Index just past the last table row in a section body."""
+    end = 0
+    for i, line in enumerate(body):
+        if line.startswith("|"):
+            end = i + 1
+    return end
+
+
+def _render_status(body: list, project: Path, exercises_path: str) -> list:
+    """Rewrite the computed lines of Current Status; leave hand-written ones."""
+    sessions = load_json(str(project / "data" / "sessions.json"))
+    cards = load_json(str(project / "data" / "cards.json")).get("cards", [])
+    topics = load_json(str(project / "data" / "topics.json")).get("topics", [])
+    ex = exercise_stats(exercises_path)["overall"]
+
+    tomorrow = (date.today() + timedelta(days=1)).isoformat()
+    ranked = sorted((t for t in topics if t.get("total_cards")), key=lambda t: t.get("mastery", 0))
+    values = {
+        "Day": len({s["date"] for s in sessions.get("sessions", [])}),
+        "Streak": f"{calculate_streak(sessions)['streak']} consecutive days",
+        "SR": (f"{len(cards)} cards total, {sum(1 for c in cards if is_mature(c))} mature, "
+               f"{sum(1 for c in cards if c['next_review'] <= tomorrow)} due tomorrow"),
+        "Exercises": f"{ex['completed']} completed out of {ex['total']} planned",
+        "Weakest area": f"{ranked[0]['name']} ({ranked[0]['mastery']:.0%})" if ranked else "N/A",
+        "Strongest area": f"{ranked[-1]['name']} ({ranked[-1]['mastery']:.0%})" if ranked else "N/A",
+    }
+
+    body = list(body)
+    for key, value in values.items():
+        line = f"- {key}: {value}"
+        for i, existing in enumerate(body):
+            if existing.startswith(f"- {key}:"):
+                body[i] = line
+                break
+        else:
+            bullets = [i for i, existing in enumerate(body) if existing.startswith("- ")]
+            body.insert(bullets[-1] + 1 if bullets else 0, line)
+    return body
+
+
+def _render_topics(body: list, project: Path, exercises_path: str) -> list:
+    """Regenerate Topic Mastery rows, keeping each topic's Notes cell.
+
+    Every column is a rollup through `parent`, as in topics.json: exercises
+    done is the topic's exercises_completed, and the total sums exercise-stats
+    over the topic and its descendants.
+    """
+    topics = load_json(str(project / "data" / "topics.json")).get("topics", [])
+    by_name = {t["name"]: t for t in topics}
+    ex_totals = dict.fromkeys(by_name, 0)
+    for name, acc in exercise_stats(exercises_path)["topics"].items():
+        seen = set()
+        while name in by_name and name not in seen:
+            seen.add(name)
+            ex_totals[name] += acc["total"]
+            name = by_name[name].get("parent")
+
+    header = [line for line in body if line.startswith("|")][:2]
+    notes = {}
+    for line in body[body.index(header[-1]) + 1:] if len(header) == 2 else []:
+        # Split on unescaped pipes only; _cell() writes literal pipes as \|
+        cells = [c.strip() for c in re.split(r"(?<!\\)\|", line.strip())[1:-1]]
+        if line.startswith("|") and len(cells) >= 5:
+            notes[cells[0]] = cells[4]
+
+    rows = []
+    for t in sorted(topics, key=lambda t: t.get("priority") or 0):
+        name = _cell(t["name"])
+        rows.append(
+            f"| {name} | {t.get('mastery', 0):.0%} "
+            f"| {t.get('mature_cards', 0)}/{t.get('total_cards', 0)} "
+            f"| {t.get('exercises_completed', 0)}/{ex_totals[t['name']]} | {notes.get(name, '')} |"
+        )
+
+    end = _table_end(body)
+    start = body.index(header[-1]) + 1 if len(header) == 2 else end
+    return body[:start] + rows + body[end:]
+
+
+def _render_session_log(body: list, project: Path, state: dict) -> tuple[list, int]:
+    """Append rows for sessions not yet in the Session Log. Returns (body, rows added)."""
+    sessions = sorted(load_json(str(project / "data" / "sessions.json")).get("sessions", []),
+                      key=lambda s: int(s["id"][1:]))
+    last = state.get("last_session")
+    if last is not None:
+        new = [s for s in sessions if int(s["id"][1:]) > int(last[1:])]
+    else:
+        # First render: skip sessions that were already logged by hand
+        logged = {line.split("|")[1].strip() for line in body if line.startswith("|")}
+        new = [s for s in sessions if s["date"] not in logged]
+
+    rows = [
+        f"| {s['date']} | {s.get('duration_minutes', 0)} min | {s.get('planned_duration', 0)} min "
+        f"| {s.get('cards_reviewed', 0)} | {s.get('cards_correct', 0)} "
+        f"| {s.get('exercises_completed', 0)} | {_cell(s.get('notes'))} |"
+        for s in new
+    ]
+    if sessions:
+        state["last_session"] = sessions[-1]["id"]
+    end = _table_end(body)
+    return body[:end] + rows + body[end:], len(rows)
+
+
+def render_report(project_dir: str) -> dict:
+    """Bring progress-report.md up to date from the project's data files.
+
+    Each section is keyed by a content hash of the data files it depends on
+    (data/report-state.json); unchanged sections are neither recomputed nor
+    rewritten. New sessions are appended to the Session Log rather than
+    regenerating it, and hand-written lines outside the computed fields stay.
+    """
+    import hashlib
+
+    project = Path(project_dir)
+    report_path = project / "progress-report.md"
+    if not report_path.exists():
+        raise FileNotFoundError(f"{report_path} not found; run init_study_project.py to create it")
+    state_path = str(project / "data" / "report-state.json")
+    exercises_path = str(project / "data" / "exercises.json")
+    state = load_json(state_path)
+    refresh_topics(str(project / "data"))
+
+    file_hashes = {}
+    for name in ("sessions", "cards", "exercises", "topics"):
+        path = project / "data" / f"{name}.json"
+        file_hashes[name] = hashlib.sha256(path.read_bytes()).hexdigest() if path.exists() else None
+
+    today = date.today().isoformat()
+    section_hashes = {}
+    for section, inputs in REPORT_SECTIONS.items():
+        key = "|".join(str(file_hashes[name]) for name in inputs)
+        if section == "Current Status":
+            key += "|" + today  # streak and due-tomorrow move with the date
+        section_hashes[section] = hashlib.sha256(key.encode()).hexdigest()[:16]
+
+    previous = state.get("sections", {})
+    stale = [s for s in REPORT_SECTIONS if section_hashes[s] != previous.get(s)]
+    if not stale:
+        return {"updated": [], "sessions_appended": 0}
+
+    preamble, sections, order = _split_sections(report_path.read_text())
+    appended = 0
+    for section in stale:
+        if section not in sections:
+            continue
+        if section == "Current Status":
+            sections[section] = _render_status(sections[section], project, exercises_path)
+        elif section == "Session Log":
+            sections[section], appended = _render_session_log(sections[section], project, state)
+        elif section == "Topic Mastery":
+            sections[section] = _render_topics(sections[section], project, exercises_path)
+
+    preamble = [f"Last updated: {today}" if line.startswith("Last updated:") else line
+                for line in preamble]
+    lines = list(preamble)
+    for heading in order:
+        lines.append(f"## {heading}")
+        lines.extend(sections[heading])
+    report_path.write_text("\n".join(lines) + "\n")
+
+    state["sections"] = section_hashes
+    save_json(state_path, state)
+    return {"updated": stale, "sessions_appended": appended}
+
+
 def main():
     if len(sys.argv) < 3:
         print(__doc__)
@@ -188,6 +386,14 @@ def main():
         brief = session_brief(sys.argv[2])
         print(json.dumps(brief, indent=2))
 
+    elif cmd == "render-report":
+        try:
+            result = render_report(sys.argv[2])
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(json.dumps(result, indent=2))
+
     else:
         print(f"Unknown command: {cmd}")
         print(__doc__)
@@ -14,10 +14,13 @@ import json
 import sys
 from pathlib import Path
 
-# Import shared helpers
-HELPERS_PATH = Path.home() / ".claude" / "skills" / "study-plan" / "scripts"
-sys.path.insert(0, str(HELPERS_PATH))
-from json_helpers import load_json, query_due_cards, update_card_after_review, card_stats
+# Import shared helpers (already on sys.path when run via studykit)
+try:
+    from json_helpers import load_json, query_due_cards, update_card_after_review, card_stats
+except ImportError:
+    HELPERS_PATH = Path.home() / ".claude" / "skills" / "study-plan" / "scripts"
+    sys.path.insert(0, str(HELPERS_PATH))
+    from json_helpers import load_json, query_due_cards, update_card_after_review, card_stats
 
 
 def get_overdue(cards_path: str) -> list: